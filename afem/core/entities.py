@@ -131,6 +131,17 @@ class ShapeHolder(NamedItem, ViewableItem):
         """
         return CheckGeom.is_curve(self.cref)
 
+    @property
+    def cref_edge(self):
+        """
+        :return: A new edge of the reference curve. *None* if reference curve
+            is not available.
+        :rtype: afem.topology.entities.Edge or None
+        """
+        if not self.has_cref:
+            return None
+        return Edge.by_curve(self._cref)
+
     @property
     def sref(self):
         """
@@ -279,21 +279,18 @@ class ImportVSP(object):
                     bodies[comp_name] = body
 
         # Attach wing reference surfaces to the bodies.
-        for sref_id in wing_bodies:
+        for sref_id, wing in wing_bodies.items():
             if sref_id not in ref_surfs:
                 continue
-            wing = wing_bodies[sref_id]
             sref = ref_surfs[sref_id]
             wing.set_sref(sref)
 
         # Attach fuselage reference surfaces to the bodies.
-        for sref_id in fuselage_bodies:
+        for sref_id, fuselage in fuselage_bodies.items():
             if sref_id in href_surfs:
-                fuselage = fuselage_bodies[sref_id]
                 sref = href_surfs[sref_id]
                 fuselage.metadata.set('hsref', sref)
             if sref_id in vref_surfs:
-                fuselage = fuselage_bodies[sref_id]
                 sref = vref_surfs[sref_id]
                 fuselage.metadata.set('vsref', sref)
 
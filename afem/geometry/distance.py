@@ -18,9 +18,11 @@
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 from math import sqrt
+from weakref import WeakKeyDictionary
 
 from OCCT.Extrema import (Extrema_ExtCC, Extrema_ExtCS, Extrema_ExtPC,
                           Extrema_ExtPS, Extrema_ExtSS)
+from numpy import argsort, empty, full, nan, sqrt as np_sqrt
 
 from afem.adaptor.entities import AdaptorCurve, AdaptorSurface
 from afem.geometry.check import CheckGeom
@@ -29,6 +31,13 @@ __all__ = ["DistancePointToCurve", "DistancePointToSurface",
            "DistanceCurveToCurve", "DistanceCurveToSurface",
            "DistanceSurfaceToSurface"]
 
+# Cached extrema results for repeated queries. Entities are held by weak
+# reference so their results are discarded when they are garbage collected.
+_CACHE_SIZE = 4096
+_pc_cache = WeakKeyDictionary()
+_ps_cache = WeakKeyDictionary()
+_cc_cache = WeakKeyDictionary()
+
 
 class DistancePointToCurve(object):
     """
@@ -40,35 +49,54 @@ class DistancePointToCurve(object):
         afem.geometry.entities.Curve or afem.topology.entities.Edge or
         afem.topology.entities.Wire
     :param float tol: The tolerance.
+    :param bool cache: Option to reuse the results of a previous query with
+        the same curve, point, and tolerance. The curve must not be modified
+        between queries if this is used.
 
     :raise RuntimeError: If ``Extrema_ExtPC`` fails.
     """
 
-    def __init__(self, pnt, crv, tol=1.0e-10):
-        adp_crv = AdaptorCurve.to_adaptor(crv)
-        tool = Extrema_ExtPC(pnt, adp_crv.object, tol)
-
-        if not tool.IsDone():
-            msg = 'Extrema between point and curve failed.'
-            raise RuntimeError(msg)
-
-        self._nsol = tool.NbExt()
-        results = []
-        for i in range(1, self._nsol + 1):
-            di = sqrt(tool.SquareDistance(i))
-            ext_pnt = tool.Point(i)
-            gp_pnt = ext_pnt.Value()
-            ui = ext_pnt.Parameter()
-            pi = CheckGeom.to_point(gp_pnt)
-            results.append((di, ui, pi))
-
-        results.sort(key=lambda tup: tup[0])
-
-        self._dmin = results[0][0]
-        self._dmax = results[-1][0]
-        self._dist = [row[0] for row in results]
-        self._prms = [row[1] for row in results]
-        self._pnts = [row[2] for row in results]
+    def __init__(self, pnt, crv, tol=1.0e-10, cache=False):
+        rows = None
+        if cache:
+            key = _point_key(pnt, tol)
+            rows = _cache_get(_pc_cache, (crv,), key)
+
+        if rows is None:
+            adp_crv = AdaptorCurve.to_adaptor(crv)
+            tool = Extrema_ExtPC(pnt, adp_crv.object, tol)
+
+            if not tool.IsDone():
+                msg = 'Extrema between point and curve failed.'
+                raise RuntimeError(msg)
+
+            nsol = tool.NbExt()
+            d2 = empty(nsol)
+            prms = empty(nsol)
+            gp_pnts = []
+            square_distance, point = tool.SquareDistance, tool.Point
+            append = gp_pnts.append
+            for i in range(nsol):
+                d2[i] = square_distance(i + 1)
+                ext_pnt = point(i + 1)
+                prms[i] = ext_pnt.Parameter()
+                append(ext_pnt.Value())
+            rows = (d2, prms, gp_pnts)
+
+            if cache:
+                _cache_put(_pc_cache, (crv,), key, rows)
+
+        d2, prms, gp_pnts = rows
+        self._nsol = d2.size
+        self._results = (d2, prms, gp_pnts)
+        self._dmin, self._dmax = None, None
+        if self._nsol:
+            self._dmin = sqrt(d2.min())
+            self._dmax = sqrt(d2.max())
+
+        # Sorted distances and points are built on first access
+        self._order, self._dist = None, None
+        self._prms, self._pnts = None, None
 
     @property
     def nsol(self):
@@ -81,16 +109,16 @@ class DistancePointToCurve(object):
     @property
     def dmin(self):
         """
-        :return: The minimum distance.
-        :rtype: float
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmin
 
     @property
     def dmax(self):
         """
-        :return: The maximum distance.
-        :rtype: float
+        :return: The maximum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmax
 
@@ -100,6 +128,7 @@ class DistancePointToCurve(object):
         :return: Sorted distances.
         :rtype: list(float)
         """
+        self._sort_results()
         return self._dist
 
     @property
@@ -108,6 +137,7 @@ class DistancePointToCurve(object):
         :return: Sorted parameters on curve.
         :rtype: list(float)
         """
+        self._sort_results()
         return self._prms
 
     @property
@@ -116,8 +146,118 @@ class DistancePointToCurve(object):
         :return: Sorted points on curve.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts is None:
+            self._pnts = self._sorted_points(self._results[2])
         return self._pnts
 
+    @staticmethod
+    def batch(pnts, crv, tol=1.0e-10):
+        """
+        Calculate the minimum distance between each point and a curve. The
+        extrema tool is initialized once for the curve and reused for all
+        the points.
+
+        :param pnts: The points.
+        :type pnts: collections.Sequence(point_like) or numpy.ndarray
+        :param crv: The curve.
+        :type crv: afem.adaptor.entities.AdaptorCurve or
+            afem.geometry.entities.Curve or afem.topology.entities.Edge or
+            afem.topology.entities.Wire
+        :param float tol: The tolerance.
+
+        :return: The minimum distance and its parameter on the curve for
+            each point. These are *nan* for a point with no solution or if
+            the extrema calculation fails for that point.
+        :rtype: tuple(numpy.ndarray)
+        """
+        adp_crv = AdaptorCurve.to_adaptor(crv)
+        tool = Extrema_ExtPC()
+        tool.Initialize(adp_crv.object, adp_crv.u1, adp_crv.u2, tol)
+
+        npts = len(pnts)
+        dmin = full(npts, nan)
+        prms = full(npts, nan)
+        perform, is_done = tool.Perform, tool.IsDone
+        to_point = CheckGeom.to_point
+        for i, pnt in enumerate(pnts):
+            perform(to_point(pnt))
+            if not is_done():
+                continue
+
+            jmin, d2min = _min_extremum(tool, tool.NbExt())
+            if not jmin:
+                continue
+
+            dmin[i] = sqrt(d2min)
+            prms[i] = tool.Point(jmin).Parameter()
+
+        return dmin, prms
+
+    @staticmethod
+    def batch_dmin(pnts, crv, tol=1.0e-10):
+        """
+        Calculate the minimum distance between each point and a curve.
+
+        :param pnts: The points.
+        :type pnts: collections.Sequence(point_like) or numpy.ndarray
+        :param crv: The curve.
+        :type crv: afem.adaptor.entities.AdaptorCurve or
+            afem.geometry.entities.Curve or afem.topology.entities.Edge or
+            afem.topology.entities.Wire
+        :param float tol: The tolerance.
+
+        :return: The minimum distance for each point. This is *nan* for a
+            point with no solution or if the extrema calculation fails for
+            that point.
+        :rtype: numpy.ndarray
+        """
+        return DistancePointToCurve.batch(pnts, crv, tol)[0]
+
+    @staticmethod
+    def dmin_only(pnt, crv, tol=1.0e-10):
+        """
+        Calculate only the minimum distance between a point and a curve.
+        No results are stored or sorted.
+
+        :param point_like pnt: The point.
+        :param crv: The curve.
+        :type crv: afem.adaptor.entities.AdaptorCurve or
+            afem.geometry.entities.Curve or afem.topology.entities.Edge or
+            afem.topology.entities.Wire
+        :param float tol: The tolerance.
+
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
+
+        :raise RuntimeError: If ``Extrema_ExtPC`` fails.
+        """
+        adp_crv = AdaptorCurve.to_adaptor(crv)
+        tool = Extrema_ExtPC(pnt, adp_crv.object, tol)
+
+        if not tool.IsDone():
+            msg = 'Extrema between point and curve failed.'
+            raise RuntimeError(msg)
+
+        return _min_distance(tool, tool.NbExt())
+
+    def _sort_results(self):
+        """
+        Sort the results by distance if not already done.
+        """
+        if self._order is not None:
+            return
+        d2, prms, _ = self._results
+        order = self._order = argsort(d2, kind='stable')
+        self._dist = np_sqrt(d2[order]).tolist()
+        self._prms = prms[order].tolist()
+
+    def _sorted_points(self, gp_pnts):
+        """
+        Convert the raw points to points in sorted order.
+        """
+        self._sort_results()
+        return [CheckGeom.to_point(gp_pnts[i]) for i in self._order]
+
 
 class DistancePointToSurface(object):
     """
@@ -128,35 +268,54 @@ class DistancePointToSurface(object):
     :type srf: afem.adaptor.entities.AdaptorSurface or
         afem.geometry.entities.Surface or afem.topology.entities.Face
     :param float tol: The tolerance.
+    :param bool cache: Option to reuse the results of a previous query with
+        the same surface, point, and tolerance. The surface must not be
+        modified between queries if this is used.
 
     :raise RuntimeError: If ``Extrema_ExtPS`` fails.
     """
 
-    def __init__(self, pnt, srf, tol=1.0e-10):
-        adp_srf = AdaptorSurface.to_adaptor(srf)
-        tool = Extrema_ExtPS(pnt, adp_srf.object, tol, tol)
-
-        if not tool.IsDone():
-            msg = 'Extrema between point and surface failed.'
-            raise RuntimeError(msg)
-
-        self._nsol = tool.NbExt()
-        results = []
-        for i in range(1, self._nsol + 1):
-            di = sqrt(tool.SquareDistance(i))
-            ext_pnt = tool.Point(i)
-            gp_pnt = ext_pnt.Value()
-            ui, vi = ext_pnt.Parameter()
-            pi = CheckGeom.to_point(gp_pnt)
-            results.append((di, (ui, vi), pi))
-
-        results.sort(key=lambda tup: tup[0])
-
-        self._dmin = results[0][0]
-        self._dmax = results[-1][0]
-        self._dist = [row[0] for row in results]
-        self._prms = [row[1] for row in results]
-        self._pnts = [row[2] for row in results]
+    def __init__(self, pnt, srf, tol=1.0e-10, cache=False):
+        rows = None
+        if cache:
+            key = _point_key(pnt, tol)
+            rows = _cache_get(_ps_cache, (srf,), key)
+
+        if rows is None:
+            adp_srf = AdaptorSurface.to_adaptor(srf)
+            tool = Extrema_ExtPS(pnt, adp_srf.object, tol, tol)
+
+            if not tool.IsDone():
+                msg = 'Extrema between point and surface failed.'
+                raise RuntimeError(msg)
+
+            nsol = tool.NbExt()
+            d2 = empty(nsol)
+            prms = empty((nsol, 2))
+            gp_pnts = []
+            square_distance, point = tool.SquareDistance, tool.Point
+            append = gp_pnts.append
+            for i in range(nsol):
+                d2[i] = square_distance(i + 1)
+                ext_pnt = point(i + 1)
+                prms[i] = ext_pnt.Parameter()
+                append(ext_pnt.Value())
+            rows = (d2, prms, gp_pnts)
+
+            if cache:
+                _cache_put(_ps_cache, (srf,), key, rows)
+
+        d2, prms, gp_pnts = rows
+        self._nsol = d2.size
+        self._results = (d2, prms, gp_pnts)
+        self._dmin, self._dmax = None, None
+        if self._nsol:
+            self._dmin = sqrt(d2.min())
+            self._dmax = sqrt(d2.max())
+
+        # Sorted distances and points are built on first access
+        self._order, self._dist = None, None
+        self._prms, self._pnts = None, None
 
     @property
     def nsol(self):
@@ -169,16 +328,16 @@ class DistancePointToSurface(object):
     @property
     def dmin(self):
         """
-        :return: The minimum distance.
-        :rtype: float
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmin
 
     @property
     def dmax(self):
         """
-        :return: The maximum distance.
-        :rtype: float
+        :return: The maximum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmax
 
@@ -188,6 +347,7 @@ class DistancePointToSurface(object):
         :return: Sorted distances.
         :rtype: list(float)
         """
+        self._sort_results()
         return self._dist
 
     @property
@@ -197,6 +357,7 @@ class DistancePointToSurface(object):
          containing the (u, v) locations.
         :rtype: list(tuple(float))
         """
+        self._sort_results()
         return self._prms
 
     @property
@@ -205,8 +366,118 @@ class DistancePointToSurface(object):
         :return: Sorted points on surface.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts is None:
+            self._pnts = self._sorted_points(self._results[2])
         return self._pnts
 
+    @staticmethod
+    def batch(pnts, srf, tol=1.0e-10):
+        """
+        Calculate the minimum distance between each point and a surface. The
+        extrema tool is initialized once for the surface and reused for all
+        the points.
+
+        :param pnts: The points.
+        :type pnts: collections.Sequence(point_like) or numpy.ndarray
+        :param srf: The surface.
+        :type srf: afem.adaptor.entities.AdaptorSurface or
+            afem.geometry.entities.Surface or afem.topology.entities.Face
+        :param float tol: The tolerance.
+
+        :return: The minimum distance and its (u, v) parameters on the
+            surface for each point. The parameters are returned as an array
+            of shape (n, 2). These are *nan* for a point with no solution or
+            if the extrema calculation fails for that point.
+        :rtype: tuple(numpy.ndarray)
+        """
+        adp_srf = AdaptorSurface.to_adaptor(srf)
+        tool = Extrema_ExtPS()
+        tool.Initialize(adp_srf.object, adp_srf.u1, adp_srf.u2, adp_srf.v1,
+                        adp_srf.v2, tol, tol)
+
+        npts = len(pnts)
+        dmin = full(npts, nan)
+        prms = full((npts, 2), nan)
+        perform, is_done = tool.Perform, tool.IsDone
+        to_point = CheckGeom.to_point
+        for i, pnt in enumerate(pnts):
+            perform(to_point(pnt))
+            if not is_done():
+                continue
+
+            jmin, d2min = _min_extremum(tool, tool.NbExt())
+            if not jmin:
+                continue
+
+            dmin[i] = sqrt(d2min)
+            prms[i] = tool.Point(jmin).Parameter()
+
+        return dmin, prms
+
+    @staticmethod
+    def batch_dmin(pnts, srf, tol=1.0e-10):
+        """
+        Calculate the minimum distance between each point and a surface.
+
+        :param pnts: The points.
+        :type pnts: collections.Sequence(point_like) or numpy.ndarray
+        :param srf: The surface.
+        :type srf: afem.adaptor.entities.AdaptorSurface or
+            afem.geometry.entities.Surface or afem.topology.entities.Face
+        :param float tol: The tolerance.
+
+        :return: The minimum distance for each point. This is *nan* for a
+            point with no solution or if the extrema calculation fails for
+            that point.
+        :rtype: numpy.ndarray
+        """
+        return DistancePointToSurface.batch(pnts, srf, tol)[0]
+
+    @staticmethod
+    def dmin_only(pnt, srf, tol=1.0e-10):
+        """
+        Calculate only the minimum distance between a point and a surface.
+        No results are stored or sorted.
+
+        :param point_like pnt: The point.
+        :param srf: The surface.
+        :type srf: afem.adaptor.entities.AdaptorSurface or
+            afem.geometry.entities.Surface or afem.topology.entities.Face
+        :param float tol: The tolerance.
+
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
+
+        :raise RuntimeError: If ``Extrema_ExtPS`` fails.
+        """
+        adp_srf = AdaptorSurface.to_adaptor(srf)
+        tool = Extrema_ExtPS(pnt, adp_srf.object, tol, tol)
+
+        if not tool.IsDone():
+            msg = 'Extrema between point and surface failed.'
+            raise RuntimeError(msg)
+
+        return _min_distance(tool, tool.NbExt())
+
+    def _sort_results(self):
+        """
+        Sort the results by distance if not already done.
+        """
+        if self._order is not None:
+            return
+        d2, prms, _ = self._results
+        order = self._order = argsort(d2, kind='stable')
+        self._dist = np_sqrt(d2[order]).tolist()
+        us, vs = prms[order].T.tolist()
+        self._prms = list(zip(us, vs))
+
+    def _sorted_points(self, gp_pnts):
+        """
+        Convert the raw points to points in sorted order.
+        """
+        self._sort_results()
+        return [CheckGeom.to_point(gp_pnts[i]) for i in self._order]
+
 
 class DistanceCurveToCurve(object):
     """
@@ -221,36 +492,57 @@ class DistanceCurveToCurve(object):
         afem.geometry.entities.Curve or afem.topology.entities.Edge or
         afem.topology.entities.Wire
     :param float tol: The tolerance.
+    :param bool cache: Option to reuse the results of a previous query with
+        the same curves and tolerance. The curves must not be modified
+        between queries if this is used.
 
     :raise RuntimeError: If ``Extrema_ExtCC`` fails.
     """
 
-    def __init__(self, crv1, crv2, tol=1.0e-10):
-        adp_crv1 = AdaptorCurve.to_adaptor(crv1)
-        adp_crv2 = AdaptorCurve.to_adaptor(crv2)
-        tool = Extrema_ExtCC(adp_crv1.object, adp_crv2.object, tol, tol)
-
-        if not tool.IsDone():
-            msg = 'Extrema between two curves failed.'
-            raise RuntimeError(msg)
-
-        self._nsol = tool.NbExt()
-        self._parallel = tool.IsParallel()
-        results = []
-        for i in range(1, self._nsol + 1):
-            di = sqrt(tool.SquareDistance(i))
-            gp_pnt1, gp_pnt2 = tool.Points(i)
-            p1 = CheckGeom.to_point(gp_pnt1)
-            p2 = CheckGeom.to_point(gp_pnt2)
-            results.append((di, p1, p2))
-
-        results.sort(key=lambda tup: tup[0])
-
-        self._dmin = results[0][0]
-        self._dmax = results[-1][0]
-        self._dist = [row[0] for row in results]
-        self._pnts1 = [row[1] for row in results]
-        self._pnts2 = [row[2] for row in results]
+    def __init__(self, crv1, crv2, tol=1.0e-10, cache=False):
+        cached = None
+        if cache:
+            cached = _cache_get(_cc_cache, (crv1, crv2), tol)
+
+        if cached is None:
+            adp_crv1 = AdaptorCurve.to_adaptor(crv1)
+            adp_crv2 = AdaptorCurve.to_adaptor(crv2)
+            tool = Extrema_ExtCC(adp_crv1.object, adp_crv2.object, tol, tol)
+
+            if not tool.IsDone():
+                msg = 'Extrema between two curves failed.'
+                raise RuntimeError(msg)
+
+            nsol = tool.NbExt()
+            parallel = tool.IsParallel()
+
+            # All extrema are the same distance if parallel so only the
+            # first one is used
+            nres = min(nsol, 1) if parallel else nsol
+            d2 = empty(nres)
+            gp_pnts1, gp_pnts2 = [], []
+            square_distance, points = tool.SquareDistance, tool.Points
+            append1, append2 = gp_pnts1.append, gp_pnts2.append
+            for i in range(nres):
+                d2[i] = square_distance(i + 1)
+                gp_pnt1, gp_pnt2 = points(i + 1)
+                append1(gp_pnt1)
+                append2(gp_pnt2)
+            cached = (parallel, nsol, d2, gp_pnts1, gp_pnts2)
+
+            if cache:
+                _cache_put(_cc_cache, (crv1, crv2), tol, cached)
+
+        self._parallel, self._nsol, d2, gp_pnts1, gp_pnts2 = cached
+        self._results = (d2, gp_pnts1, gp_pnts2)
+        self._dmin, self._dmax = None, None
+        if self._nsol:
+            self._dmin = sqrt(d2.min())
+            self._dmax = sqrt(d2.max())
+
+        # Sorted distances and points are built on first access
+        self._order, self._dist = None, None
+        self._pnts1, self._pnts2 = None, None
 
     @property
     def nsol(self):
@@ -263,7 +555,9 @@ class DistanceCurveToCurve(object):
     @property
     def is_parallel(self):
         """
-        :return: *True* if curves were parallel.
+        :return: *True* if curves were parallel. If so, the sorted results
+            only contain the first extremum since they are all the same
+            distance.
         :rtype: bool
         """
         return self._parallel
@@ -271,16 +565,16 @@ class DistanceCurveToCurve(object):
     @property
     def dmin(self):
         """
-        :return: The minimum distance.
-        :rtype: float
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmin
 
     @property
     def dmax(self):
         """
-        :return: The maximum distance.
-        :rtype: float
+        :return: The maximum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmax
 
@@ -290,6 +584,7 @@ class DistanceCurveToCurve(object):
         :return: Sorted distances.
         :rtype: list(float)
         """
+        self._sort_results()
         return self._dist
 
     @property
@@ -298,6 +593,8 @@ class DistanceCurveToCurve(object):
         :return: Sorted points on first curve.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts1 is None:
+            self._pnts1 = self._sorted_points(self._results[1])
         return self._pnts1
 
     @property
@@ -306,8 +603,61 @@ class DistanceCurveToCurve(object):
         :return: Sorted points on second curve.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts2 is None:
+            self._pnts2 = self._sorted_points(self._results[2])
         return self._pnts2
 
+    @staticmethod
+    def dmin_only(crv1, crv2, tol=1.0e-10):
+        """
+        Calculate only the minimum distance between two curves. No results
+        are stored or sorted.
+
+        :param crv1: The first curve.
+        :type crv1: afem.adaptor.entities.AdaptorCurve or
+            afem.geometry.entities.Curve or afem.topology.entities.Edge or
+            afem.topology.entities.Wire
+        :param crv2: The second curve.
+        :type crv2: afem.adaptor.entities.AdaptorCurve or
+            afem.geometry.entities.Curve or afem.topology.entities.Edge or
+            afem.topology.entities.Wire
+        :param float tol: The tolerance.
+
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
+
+        :raise RuntimeError: If ``Extrema_ExtCC`` fails.
+        """
+        adp_crv1 = AdaptorCurve.to_adaptor(crv1)
+        adp_crv2 = AdaptorCurve.to_adaptor(crv2)
+        tool = Extrema_ExtCC(adp_crv1.object, adp_crv2.object, tol, tol)
+
+        if not tool.IsDone():
+            msg = 'Extrema between two curves failed.'
+            raise RuntimeError(msg)
+
+        nsol = tool.NbExt()
+        if tool.IsParallel():
+            nsol = min(nsol, 1)
+        return _min_distance(tool, nsol)
+
+    def _sort_results(self):
+        """
+        Sort the results by distance if not already done.
+        """
+        if self._order is not None:
+            return
+        d2 = self._results[0]
+        order = self._order = argsort(d2, kind='stable')
+        self._dist = np_sqrt(d2[order]).tolist()
+
+    def _sorted_points(self, gp_pnts):
+        """
+        Convert the raw points to points in sorted order.
+        """
+        self._sort_results()
+        return [CheckGeom.to_point(gp_pnts[i]) for i in self._order]
+
 
 class DistanceCurveToSurface(object):
     """
@@ -336,21 +686,29 @@ class DistanceCurveToSurface(object):
 
         self._nsol = tool.NbExt()
         self._parallel = tool.IsParallel()
-        results = []
-        for i in range(1, self._nsol + 1):
-            di = sqrt(tool.SquareDistance(i))
-            gp_pnt1, gp_pnt2 = tool.Points(i)
-            p1 = CheckGeom.to_point(gp_pnt1)
-            p2 = CheckGeom.to_point(gp_pnt2)
-            results.append((di, p1, p2))
-
-        results.sort(key=lambda tup: tup[0])
 
-        self._dmin = results[0][0]
-        self._dmax = results[-1][0]
-        self._dist = [row[0] for row in results]
-        self._pnts1 = [row[1] for row in results]
-        self._pnts2 = [row[2] for row in results]
+        # All extrema are the same distance if parallel so only the first one
+        # is used
+        nres = min(self._nsol, 1) if self._parallel else self._nsol
+        d2 = empty(nres)
+        gp_pnts1, gp_pnts2 = [], []
+        square_distance, points = tool.SquareDistance, tool.Points
+        append1, append2 = gp_pnts1.append, gp_pnts2.append
+        for i in range(nres):
+            d2[i] = square_distance(i + 1)
+            gp_pnt1, gp_pnt2 = points(i + 1)
+            append1(gp_pnt1)
+            append2(gp_pnt2)
+
+        self._results = (d2, gp_pnts1, gp_pnts2)
+        self._dmin, self._dmax = None, None
+        if self._nsol:
+            self._dmin = sqrt(d2.min())
+            self._dmax = sqrt(d2.max())
+
+        # Sorted distances and points are built on first access
+        self._order, self._dist = None, None
+        self._pnts1, self._pnts2 = None, None
 
     @property
     def nsol(self):
@@ -363,7 +721,9 @@ class DistanceCurveToSurface(object):
     @property
     def is_parallel(self):
         """
-        :return: *True* if the curve and surface were parallel.
+        :return: *True* if the curve and surface were parallel. If so, the
+            sorted results only contain the first extremum since they are
+            all the same distance.
         :rtype: bool
         """
         return self._parallel
@@ -371,16 +731,16 @@ class DistanceCurveToSurface(object):
     @property
     def dmin(self):
         """
-        :return: The minimum distance.
-        :rtype: float
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmin
 
     @property
     def dmax(self):
         """
-        :return: The maximum distance.
-        :rtype: float
+        :return: The maximum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmax
 
@@ -390,6 +750,7 @@ class DistanceCurveToSurface(object):
         :return: Sorted distances.
         :rtype: list(float)
         """
+        self._sort_results()
         return self._dist
 
     @property
@@ -398,6 +759,8 @@ class DistanceCurveToSurface(object):
         :return: Sorted points on the curve.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts1 is None:
+            self._pnts1 = self._sorted_points(self._results[1])
         return self._pnts1
 
     @property
@@ -406,8 +769,60 @@ class DistanceCurveToSurface(object):
         :return: Sorted points on the surface.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts2 is None:
+            self._pnts2 = self._sorted_points(self._results[2])
         return self._pnts2
 
+    @staticmethod
+    def dmin_only(crv, srf, tol=1.0e-10):
+        """
+        Calculate only the minimum distance between a curve and a surface.
+        No results are stored or sorted.
+
+        :param crv: The curve.
+        :type crv: afem.adaptor.entities.AdaptorCurve or
+            afem.geometry.entities.Curve or afem.topology.entities.Edge or
+            afem.topology.entities.Wire
+        :param srf: The surface.
+        :type srf: afem.adaptor.entities.AdaptorSurface or
+            afem.geometry.entities.Surface or afem.topology.entities.Face
+        :param float tol: The tolerance.
+
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
+
+        :raise RuntimeError: If ``Extrema_ExtCS`` fails.
+        """
+        adp_crv = AdaptorCurve.to_adaptor(crv)
+        adp_srf = AdaptorSurface.to_adaptor(srf)
+        tool = Extrema_ExtCS(adp_crv.object, adp_srf.object, tol, tol)
+
+        if not tool.IsDone():
+            msg = 'Extrema between curve and surface failed.'
+            raise RuntimeError(msg)
+
+        nsol = tool.NbExt()
+        if tool.IsParallel():
+            nsol = min(nsol, 1)
+        return _min_distance(tool, nsol)
+
+    def _sort_results(self):
+        """
+        Sort the results by distance if not already done.
+        """
+        if self._order is not None:
+            return
+        d2 = self._results[0]
+        order = self._order = argsort(d2, kind='stable')
+        self._dist = np_sqrt(d2[order]).tolist()
+
+    def _sorted_points(self, gp_pnts):
+        """
+        Convert the raw points to points in sorted order.
+        """
+        self._sort_results()
+        return [CheckGeom.to_point(gp_pnts[i]) for i in self._order]
+
 
 class DistanceSurfaceToSurface(object):
     """
@@ -435,21 +850,29 @@ class DistanceSurfaceToSurface(object):
 
         self._nsol = tool.NbExt()
         self._parallel = tool.IsParallel()
-        results = []
-        for i in range(1, self._nsol + 1):
-            di = sqrt(tool.SquareDistance(i))
-            gp_pnt1, gp_pnt2 = tool.Points(i)
-            p1 = CheckGeom.to_point(gp_pnt1)
-            p2 = CheckGeom.to_point(gp_pnt2)
-            results.append((di, p1, p2))
-
-        results.sort(key=lambda tup: tup[0])
 
-        self._dmin = results[0][0]
-        self._dmax = results[-1][0]
-        self._dist = [row[0] for row in results]
-        self._pnts1 = [row[1] for row in results]
-        self._pnts2 = [row[2] for row in results]
+        # All extrema are the same distance if parallel so only the first one
+        # is used
+        nres = min(self._nsol, 1) if self._parallel else self._nsol
+        d2 = empty(nres)
+        gp_pnts1, gp_pnts2 = [], []
+        square_distance, points = tool.SquareDistance, tool.Points
+        append1, append2 = gp_pnts1.append, gp_pnts2.append
+        for i in range(nres):
+            d2[i] = square_distance(i + 1)
+            gp_pnt1, gp_pnt2 = points(i + 1)
+            append1(gp_pnt1)
+            append2(gp_pnt2)
+
+        self._results = (d2, gp_pnts1, gp_pnts2)
+        self._dmin, self._dmax = None, None
+        if self._nsol:
+            self._dmin = sqrt(d2.min())
+            self._dmax = sqrt(d2.max())
+
+        # Sorted distances and points are built on first access
+        self._order, self._dist = None, None
+        self._pnts1, self._pnts2 = None, None
 
     @property
     def nsol(self):
@@ -462,7 +885,9 @@ class DistanceSurfaceToSurface(object):
     @property
     def is_parallel(self):
         """
-        :return: *True* if the curve and surface were parallel.
+        :return: *True* if the surfaces were parallel. If so, the sorted
+            results only contain the first extremum since they are all the
+            same distance.
         :rtype: bool
         """
         return self._parallel
@@ -470,16 +895,16 @@ class DistanceSurfaceToSurface(object):
     @property
     def dmin(self):
         """
-        :return: The minimum distance.
-        :rtype: float
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmin
 
     @property
     def dmax(self):
         """
-        :return: The maximum distance.
-        :rtype: float
+        :return: The maximum distance. *None* if there are no solutions.
+        :rtype: float or None
         """
         return self._dmax
 
@@ -489,6 +914,7 @@ class DistanceSurfaceToSurface(object):
         :return: Sorted distances.
         :rtype: list(float)
         """
+        self._sort_results()
         return self._dist
 
     @property
@@ -497,6 +923,8 @@ class DistanceSurfaceToSurface(object):
         :return: Sorted points on the first surface.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts1 is None:
+            self._pnts1 = self._sorted_points(self._results[1])
         return self._pnts1
 
     @property
@@ -505,4 +933,124 @@ class DistanceSurfaceToSurface(object):
         :return: Sorted points on the second surface.
         :rtype: list(afem.geometry.entities.Point)
         """
+        if self._pnts2 is None:
+            self._pnts2 = self._sorted_points(self._results[2])
         return self._pnts2
+
+    @staticmethod
+    def dmin_only(srf1, srf2, tol=1.0e-10):
+        """
+        Calculate only the minimum distance between two surfaces. No
+        results are stored or sorted.
+
+        :param srf1: The first surface.
+        :type srf1: afem.adaptor.entities.AdaptorSurface or
+            afem.geometry.entities.Surface or afem.topology.entities.Face
+        :param srf2: The second surface.
+        :type srf2: afem.adaptor.entities.AdaptorSurface or
+            afem.geometry.entities.Surface or afem.topology.entities.Face
+        :param float tol: The tolerance.
+
+        :return: The minimum distance. *None* if there are no solutions.
+        :rtype: float or None
+
+        :raise RuntimeError: If ``Extrema_ExtSS`` fails.
+        """
+        adp_srf1 = AdaptorSurface.to_adaptor(srf1)
+        adp_srf2 = AdaptorSurface.to_adaptor(srf2)
+        tool = Extrema_ExtSS(adp_srf1.object, adp_srf2.object, tol, tol)
+
+        if not tool.IsDone():
+            msg = 'Extrema between two surfaces failed.'
+            raise RuntimeError(msg)
+
+        nsol = tool.NbExt()
+        if tool.IsParallel():
+            nsol = min(nsol, 1)
+        return _min_distance(tool, nsol)
+
+    def _sort_results(self):
+        """
+        Sort the results by distance if not already done.
+        """
+        if self._order is not None:
+            return
+        d2 = self._results[0]
+        order = self._order = argsort(d2, kind='stable')
+        self._dist = np_sqrt(d2[order]).tolist()
+
+    def _sorted_points(self, gp_pnts):
+        """
+        Convert the raw points to points in sorted order.
+        """
+        self._sort_results()
+        return [CheckGeom.to_point(gp_pnts[i]) for i in self._order]
+
+
+def _point_key(pnt, tol):
+    """
+    Hashable key for a point query quantized at a fraction of the tolerance.
+    """
+    pnt = CheckGeom.to_point(pnt)
+    if tol <= 0.:
+        return pnt.x, pnt.y, pnt.z, tol
+    q = 0.1 * tol
+    return round(pnt.x / q), round(pnt.y / q), round(pnt.z / q), tol
+
+
+def _cache_get(cache, entities, key):
+    """
+    Get cached results for the entities and key, or *None* if not found.
+    """
+    try:
+        for entity in entities:
+            cache = cache[entity]
+        return cache[key]
+    except (KeyError, TypeError):
+        return None
+
+
+def _cache_put(cache, entities, key, value):
+    """
+    Cache results for the entities and key. Nothing is cached if an entity
+    cannot be weakly referenced.
+    """
+    try:
+        for i, entity in enumerate(entities, 1):
+            if entity not in cache:
+                if i == len(entities):
+                    cache[entity] = {}
+                else:
+                    cache[entity] = WeakKeyDictionary()
+            cache = cache[entity]
+    except TypeError:
+        return
+
+    if len(cache) >= _CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _min_distance(tool, nsol):
+    """
+    Minimum distance of the first solutions of an extrema tool.
+    """
+    d2min = _min_extremum(tool, nsol)[1]
+    if d2min is None:
+        return None
+    return sqrt(d2min)
+
+
+def _min_extremum(tool, nsol):
+    """
+    Index and square distance of the nearest of the first solutions of an
+    extrema tool. The index is 0 and the distance is *None* if there are no
+    solutions.
+    """
+    imin, d2min = 0, None
+    square_distance = tool.SquareDistance
+    for i in range(1, nsol + 1):
+        d2 = square_distance(i)
+        if d2min is None or d2 < d2min:
+            imin, d2min = i, d2
+    return imin, d2min
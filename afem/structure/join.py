@@ -17,12 +17,10 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
-from numpy import mean
-
 from afem.structure.entities import SurfacePart
 from afem.topology.bop import FuseShapes, IntersectShapes, SplitShapes
-from afem.topology.create import CompoundByShapes, EdgeByCurve
-from afem.topology.entities import Shape
+from afem.topology.create import CompoundByShapes
+from afem.topology.entities import BBox, Shape
 from afem.topology.modify import RebuildShapesByTool, SewShape
 from afem.config import logger
 
@@ -52,9 +50,10 @@ class FuseSurfaceParts(object):
         bop.set_tools(tools)
         bop.build()
 
-        rebuild = RebuildShapesByTool(args + tools, bop)
-        for part in parts + other_parts:
-            new_shape = rebuild.new_shape(part.shape)
+        all_shapes = args + tools
+        rebuild = RebuildShapesByTool(all_shapes, bop)
+        for part, old_shape in zip(parts + other_parts, all_shapes):
+            new_shape = rebuild.new_shape(old_shape)
             part.set_shape(new_shape)
 
         self._is_done = bop.is_done
@@ -100,10 +99,24 @@ class FuseSurfacePartsByCref(object):
                 msg = 'Part is not a surface part.'
                 raise TypeError(msg)
 
+        # Build the reference curve edges, their bounding boxes, and the
+        # part tolerances once
+        nparts = len(parts)
+        edges = [None] * nparts
+        boxes = [None] * nparts
+        tols = [tol] * nparts
+        for i, part in enumerate(parts):
+            if not part.has_cref:
+                continue
+            if tol is None:
+                tols[i] = part.shape.tol_max
+            edges[i] = part.cref_edge
+            boxes[i] = BBox()
+            boxes[i].add_shape(edges[i])
+
         # Test all combinations of parts for intersection of reference curve
         join_parts = []
         main_parts = []
-        nparts = len(parts)
         for i in range(0, nparts - 1):
             main = parts[i]
             other_parts = []
@@ -111,15 +124,11 @@ class FuseSurfacePartsByCref(object):
                 other = parts[j]
                 if not main.has_cref or not other.has_cref:
                     continue
-                if tol is None:
-                    tol1 = main.shape.tol_max
-                    tol2 = other.shape.tol_max
-                    _tol = max(tol1, tol2)
-                else:
-                    _tol = tol
-                e1 = EdgeByCurve(main.cref).edge
-                e2 = EdgeByCurve(other.cref).edge
-                bop = IntersectShapes(e1, e2, fuzzy_val=_tol)
+                _tol = max(tols[i], tols[j])
+                # Skip the intersection if the boxes are too far apart
+                if boxes[i].distance(boxes[j]) > _tol:
+                    continue
+                bop = IntersectShapes(edges[i], edges[j], fuzzy_val=_tol)
                 if not bop.vertices:
                     continue
                 # Store potential join
@@ -160,7 +169,9 @@ class CutParts(object):
 
         shape2 = Shape.to_shape(shape)
 
-        # Loop through each since since that seems to be more robust
+        # Loop through each part since that seems to be more robust. The
+        # cuts are not run in separate processes since passing the shapes
+        # back would break the edges and vertices shared by fused parts.
         self._status = {}
         for part in parts:
             status = part.cut(shape2)
@@ -205,23 +216,33 @@ class SewSurfaceParts(object):
         parts = list(parts)
         shapes = [part.shape for part in parts]
 
+        # Gather the default tolerances in a single pass
+        sum_tol, tol_max = 0., 0.
+        for shape in shapes:
+            if tol is None:
+                sum_tol += shape.tol_avg
+            if max_tol is None:
+                tol_max = max(tol_max, shape.tol_max)
+
         if tol is None:
-            tol = mean([shape.tol_avg for shape in shapes], dtype=float)
+            tol = sum_tol / len(shapes)
 
         if max_tol is None:
-            max_tol = max([shape.tol_max for shape in shapes])
+            max_tol = tol_max
 
+        # The sewing tool needs the tolerances up front so the shapes are
+        # added in a second pass
         sew = SewShape(tol=tol, max_tol=max_tol, cut_free_edges=True,
                        non_manifold=True)
 
-        for part in parts:
-            sew.add(part.shape)
+        for shape in shapes:
+            sew.add(shape)
         sew.perform()
 
-        for part in parts:
-            if not sew.is_modified(part.shape):
+        for part, shape in zip(parts, shapes):
+            if not sew.is_modified(shape):
                 continue
-            mod_shape = sew.modified(part.shape)
+            mod_shape = sew.modified(shape)
             part.set_shape(mod_shape)
 
 
@@ -250,8 +271,8 @@ class SplitParts(object):
         bop.build()
 
         rebuild = RebuildShapesByTool(args, bop)
-        for part in parts:
-            new_shape = rebuild.new_shape(part.shape)
+        for part, old_shape in zip(parts, args):
+            new_shape = rebuild.new_shape(old_shape)
             part.set_shape(new_shape)
 
         self._is_done = bop.is_done
@@ -316,8 +337,8 @@ class FuseGroups(object):
         all_parts = parts1 + other_parts
         all_shapes = [part.shape for part in all_parts]
         rebuild = RebuildShapesByTool(all_shapes, bop)
-        for part in all_parts:
-            new_shape = rebuild.new_shape(part.shape)
+        for part, old_shape in zip(all_parts, all_shapes):
+            new_shape = rebuild.new_shape(old_shape)
             part.set_shape(new_shape)
 
         self._bop = bop
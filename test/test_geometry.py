@@ -19,7 +19,10 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 import unittest
 
+from numpy import array
+
 from afem.geometry import *
+from afem.geometry.distance import _cc_cache, _pc_cache, _ps_cache
 
 
 class TestGeometryCreate(unittest.TestCase):
@@ -373,6 +376,95 @@ class TestGeometryDistance(unittest.TestCase):
         p = Point(5., 1., 0.)
         dist = DistancePointToCurve(p, c)
         self.assertEqual(dist.nsol, 1)
+        self.assertAlmostEqual(dist.dmin, 1.)
+        self.assertAlmostEqual(dist.dmax, 1.)
+        self.assertEqual(len(dist.distances), 1)
+        self.assertAlmostEqual(dist.distances[0], 1.)
+        self.assertAlmostEqual(DistancePointToCurve.dmin_only(p, c), 1.)
+
+    def test_distance_point_to_curve_no_solution(self):
+        line = LineByPoints((0., 0., 0.), (10., 0., 0.)).line
+        c = TrimmedCurve.by_parameters(line, 0., 10.)
+        p = Point(15., 1., 0.)
+        dist = DistancePointToCurve(p, c)
+        self.assertEqual(dist.nsol, 0)
+        self.assertIsNone(dist.dmin)
+        self.assertIsNone(dist.dmax)
+        self.assertEqual(dist.distances, [])
+        self.assertIsNone(DistancePointToCurve.dmin_only(p, c))
+
+    def test_distance_point_to_curve_cache(self):
+        c = NurbsCurveByPoints([(0., 0., 0.), (10., 0., 0.)]).curve
+        p = Point(5., 1., 0.)
+        dist1 = DistancePointToCurve(p, c, cache=True)
+        self.assertIn(c, _pc_cache)
+        self.assertEqual(len(_pc_cache[c]), 1)
+        dist2 = DistancePointToCurve(p, c, cache=True)
+        self.assertEqual(len(_pc_cache[c]), 1)
+        self.assertEqual(dist1.nsol, dist2.nsol)
+        self.assertAlmostEqual(dist1.dmin, dist2.dmin)
+        self.assertIsNot(dist1.points[0], dist2.points[0])
+        dist3 = DistancePointToCurve(p, c, tol=0., cache=True)
+        self.assertAlmostEqual(dist3.dmin, 1.)
+
+    def test_distance_point_to_surface_cache(self):
+        c1 = NurbsCurveByPoints([(0., 0., 0.), (10., 0., 0.)]).curve
+        c2 = NurbsCurveByPoints([(0., 5., 0.), (10., 5., 0.)]).curve
+        c3 = NurbsCurveByPoints([(0., 10., 0.), (10., 10., 0.)]).curve
+        s = NurbsSurfaceByApprox([c1, c2, c3]).surface
+        p = Point(5., 5., 1.)
+        dist1 = DistancePointToSurface(p, s, cache=True)
+        self.assertIn(s, _ps_cache)
+        self.assertEqual(len(_ps_cache[s]), 1)
+        dist2 = DistancePointToSurface(p, s, cache=True)
+        self.assertEqual(len(_ps_cache[s]), 1)
+        self.assertAlmostEqual(dist1.dmin, 1.)
+        self.assertAlmostEqual(dist1.dmin, dist2.dmin)
+
+    def test_distance_curve_to_curve_parallel(self):
+        line1 = LineByPoints((0., 0., 0.), (10., 0., 0.)).line
+        line2 = LineByPoints((0., 1., 0.), (10., 1., 0.)).line
+        c1 = TrimmedCurve.by_parameters(line1, 0., 10.)
+        c2 = TrimmedCurve.by_parameters(line2, 0., 10.)
+        dist = DistanceCurveToCurve(c1, c2)
+        self.assertTrue(dist.is_parallel)
+        self.assertGreaterEqual(dist.nsol, 1)
+        self.assertEqual(len(dist.distances), 1)
+        self.assertEqual(len(dist.points1), 1)
+        self.assertEqual(len(dist.points2), 1)
+        self.assertAlmostEqual(dist.dmin, 1.)
+        self.assertEqual(dist.dmin, dist.dmax)
+
+    def test_distance_curve_to_curve_cache(self):
+        c1 = NurbsCurveByPoints([(0., 0., 0.), (10., 0., 0.)]).curve
+        c2 = NurbsCurveByPoints([(5., 1., -5.), (5., 1., 5.)]).curve
+        dist1 = DistanceCurveToCurve(c1, c2, cache=True)
+        self.assertIn(c1, _cc_cache)
+        self.assertIn(c2, _cc_cache[c1])
+        dist2 = DistanceCurveToCurve(c1, c2, cache=True)
+        self.assertEqual(len(_cc_cache[c1][c2]), 1)
+        self.assertAlmostEqual(dist1.dmin, dist2.dmin)
+
+    def test_distance_point_to_curve_batch(self):
+        c = NurbsCurveByPoints([(0., 0., 0.), (10., 0., 0.)]).curve
+        pnts = [(5., 1., 0.), (2., 2., 0.)]
+        dmin, prms = DistancePointToCurve.batch(pnts, c)
+        self.assertAlmostEqual(dmin[0], 1.)
+        self.assertAlmostEqual(dmin[1], 2.)
+        self.assertEqual(len(prms), 2)
+
+    def test_distance_point_to_surface_batch(self):
+        c1 = NurbsCurveByPoints([(0., 0., 0.), (10., 0., 0.)]).curve
+        c2 = NurbsCurveByPoints([(0., 5., 0.), (10., 5., 0.)]).curve
+        c3 = NurbsCurveByPoints([(0., 10., 0.), (10., 10., 0.)]).curve
+        s = NurbsSurfaceByApprox([c1, c2, c3]).surface
+        pnts = array([(5., 5., 1.), (2., 2., -3.)])
+        dmin, prms = DistancePointToSurface.batch(pnts, s)
+        self.assertAlmostEqual(dmin[0], 1.)
+        self.assertAlmostEqual(dmin[1], 3.)
+        self.assertEqual(prms.shape, (2, 2))
+        dmin = DistancePointToSurface.batch_dmin(pnts, s)
+        self.assertAlmostEqual(dmin[1], 3.)
 
 
 class TestGeometryIntersect(unittest.TestCase):
@@ -87,6 +87,14 @@ class TestStructureEntities(unittest.TestCase):
     def test_part_cref(self):
         self.assertIsInstance(self.fspar.cref, TrimmedCurve)
 
+    def test_part_cref_edge(self):
+        e = self.fspar.cref_edge
+        self.assertIsInstance(e, Edge)
+        u1, u2 = self.fspar.cref.u1, self.fspar.cref.u2
+        self.addCleanup(self.fspar.cref.set_trim, u1, u2)
+        self.fspar.cref.set_trim(u1, 0.5 * (u1 + u2))
+        self.assertLess(self.fspar.cref_edge.length, e.length)
+
     def test_part_sref(self):
         self.assertIsInstance(self.fspar.sref, Plane)
 
@@ -447,5 +455,45 @@ class TestStructureCreate(unittest.TestCase):
         self.assertIsInstance(skin, Skin)
 
 
+class TestStructureJoin(unittest.TestCase):
+    """
+    Test cases for afem.structure.join.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        shape = brep.read_brep('./test_io/rhs_wing.brep')
+        cls.wing = Body(shape, 'wing')
+        face = brep.read_brep('./test_io/rhs_wing_sref.brep')
+        sref = face.surface
+        cls.wing.set_sref(sref)
+
+    def tearDown(self):
+        GroupAPI.reset()
+
+    def test_fuse_surface_parts_by_cref_rib_end(self):
+        fspar = SparByParameters('fspar', 0.15, 0.1, 0.15, 0.9,
+                                 self.wing).part
+        rspar = SparByParameters('rspar', 0.65, 0.1, 0.65, 0.9,
+                                 self.wing).part
+        p1 = fspar.cref.eval(0.5 * (fspar.cref.u1 + fspar.cref.u2))
+        p2 = rspar.cref.eval(0.5 * (rspar.cref.u1 + rspar.cref.u2))
+        rib = RibByPoints('rib', p1, p2, self.wing).part
+        nedges = fspar.shape.num_edges
+        fuse = FuseSurfacePartsByCref([fspar, rspar, rib])
+        self.assertTrue(fuse.is_done)
+        self.assertGreater(fspar.shape.num_edges, nedges)
+
+    def test_fuse_surface_parts_by_cref_no_joint(self):
+        spar = SparByParameters('spar', 0.15, 0.1, 0.65, 0.9, self.wing).part
+        rib = RibByParameters('rib', 0.55, 0.15, 0.65, 0.15, self.wing).part
+        box1, box2 = BBox(), BBox()
+        box1.add_shape(spar.cref_edge)
+        box2.add_shape(rib.cref_edge)
+        self.assertAlmostEqual(box1.distance(box2), 0.)
+        fuse = FuseSurfacePartsByCref([spar, rib])
+        self.assertFalse(fuse.is_done)
+
+
 if __name__ == '__main__':
     unittest.main()